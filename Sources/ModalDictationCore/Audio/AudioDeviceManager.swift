@@ -1,5 +1,6 @@
 import Foundation
 import CoreAudio
+import os
 
 public enum AudioDeviceError: Error {
     case coreAudioError(OSStatus)
@@ -15,19 +16,111 @@ public struct AudioDevice: Sendable, Equatable, Identifiable {
     public var id: String { uid }
 }
 
-public final class AudioDeviceManager: Sendable {
+// @unchecked: the only non-Sendable member is the immutable HAL listener block.
+public final class AudioDeviceManager: @unchecked Sendable {
 
-    public init() {}
+    private struct CachedDevices {
+        let devices: [AudioDevice]
+        let fetchedAt: ContinuousClock.Instant
+    }
+
+    private enum ListenerState {
+        case unregistered
+        case registering
+        case registered
+        case failed
+        // An injected enumerator has no HAL devices to watch; only invalidateDeviceCache() clears it.
+        case notNeeded
+    }
+
+    private struct State {
+        var cached: CachedDevices?
+        // Bumped on every invalidation so an enumeration that raced a hotplug doesn't store stale results.
+        var generation = 0
+        var listener: ListenerState
+
+        var isCaching: Bool { listener == .registered || listener == .notNeeded }
+
+        mutating func invalidate() {
+            cached = nil
+            generation += 1
+        }
+    }
+
+    public static let defaultCacheTTL: Duration = .seconds(5)
+
+    private static let devicesAddress = AudioObjectPropertyAddress(
+        mSelector: kAudioHardwarePropertyDevices,
+        mScope: kAudioObjectPropertyScopeGlobal,
+        mElement: kAudioObjectPropertyElementMain
+    )
+
+    private let cacheTTL: Duration
+    private let now: @Sendable () -> ContinuousClock.Instant
+    private let enumerator: (@Sendable () throws -> [AudioDevice])?
+    private let state: OSAllocatedUnfairLock<State>
+    private let listenerQueue = DispatchQueue(label: "audio-device-listener", qos: .utility)
+    private let devicesListener: AudioObjectPropertyListenerBlock
+
+    // Construction never touches the HAL; the hotplug listener is registered on first enumeration.
+    public convenience init(cacheTTL: Duration = AudioDeviceManager.defaultCacheTTL) {
+        self.init(cacheTTL: cacheTTL, now: { ContinuousClock.now }, enumerator: nil)
+    }
+
+    // A nil enumerator walks the HAL; tests inject one along with the clock to observe caching
+    // without registering a real CoreAudio listener.
+    init(
+        cacheTTL: Duration,
+        now: @escaping @Sendable () -> ContinuousClock.Instant,
+        enumerator: (@Sendable () throws -> [AudioDevice])?
+    ) {
+        let state = OSAllocatedUnfairLock(
+            initialState: State(listener: enumerator == nil ? .unregistered : .notNeeded)
+        )
+        self.cacheTTL = cacheTTL
+        self.now = now
+        self.enumerator = enumerator
+        self.state = state
+        self.devicesListener = { _, _ in
+            state.withLock { $0.invalidate() }
+        }
+    }
+
+    deinit {
+        removeDevicesListener()
+    }
 
+    // Enumeration walks every HAL device with several property reads each, so results are
+    // cached for cacheTTL and dropped early whenever CoreAudio reports a device list change.
     public func listInputDevices() throws -> [AudioDevice] {
+        installDevicesListenerIfNeeded()
+        let now = self.now()
+        let (cached, generation, isCaching) = state.withLock {
+            ($0.cached, $0.generation, $0.isCaching)
+        }
+        // Without a live hotplug listener a cached list could go stale unnoticed, so always enumerate.
+        guard isCaching else { return try enumerator?() ?? enumerateInputDevices() }
+
+        if let cached, now - cached.fetchedAt < cacheTTL {
+            return cached.devices
+        }
+        let devices = try enumerator?() ?? enumerateInputDevices()
+        state.withLock { current in
+            guard current.generation == generation else { return }
+            current.cached = CachedDevices(devices: devices, fetchedAt: now)
+        }
+        return devices
+    }
+
+    public func invalidateDeviceCache() {
+        state.withLock { $0.invalidate() }
+    }
+
+    private func enumerateInputDevices() throws -> [AudioDevice] {
         let allDeviceIDs = try getAllDeviceIDs()
         return allDeviceIDs.compactMap { deviceID in
             guard hasInputStreams(deviceID) else { return nil }
-            guard let uid = try? getStringProperty(deviceID, selector: kAudioDevicePropertyDeviceUID),
-                  let name = try? getStringProperty(deviceID, selector: kAudioDevicePropertyDeviceNameCFString)
-            else { return nil }
-            let sampleRate = (try? getSampleRate(deviceID)) ?? 0
-            return AudioDevice(audioDeviceID: deviceID, uid: uid, name: name, sampleRate: sampleRate)
+            return makeDevice(deviceID)
         }
     }
 
@@ -44,13 +137,11 @@ public final class AudioDeviceManager: Sendable {
         )
         guard status == noErr else { throw AudioDeviceError.coreAudioError(status) }
 
-        guard let uid = try? getStringProperty(deviceID, selector: kAudioDevicePropertyDeviceUID),
-              let name = try? getStringProperty(deviceID, selector: kAudioDevicePropertyDeviceNameCFString)
-        else { throw AudioDeviceError.deviceNotFound("default") }
-        let sampleRate = (try? getSampleRate(deviceID)) ?? 0
-        return AudioDevice(audioDeviceID: deviceID, uid: uid, name: name, sampleRate: sampleRate)
+        guard let device = makeDevice(deviceID) else { throw AudioDeviceError.deviceNotFound("default") }
+        return device
     }
 
+    // Served from the enumeration cache so repeated session starts don't re-walk the HAL.
     public func device(forUID uid: String) throws -> AudioDevice? {
         try listInputDevices().first { $0.uid == uid }
     }
@@ -62,6 +153,39 @@ public final class AudioDeviceManager: Sendable {
         return try defaultInputDevice()
     }
 
+    private func makeDevice(_ deviceID: AudioDeviceID) -> AudioDevice? {
+        guard let uid = try? getStringProperty(deviceID, selector: kAudioDevicePropertyDeviceUID),
+              let name = try? getStringProperty(deviceID, selector: kAudioDevicePropertyDeviceNameCFString)
+        else { return nil }
+        let sampleRate = (try? getSampleRate(deviceID)) ?? 0
+        return AudioDevice(audioDeviceID: deviceID, uid: uid, name: name, sampleRate: sampleRate)
+    }
+
+    // One-shot: the first caller claims registration and makes the HAL call outside the lock;
+    // a failed registration is not retried and leaves the cache disabled.
+    private func installDevicesListenerIfNeeded() {
+        let shouldRegister = state.withLock { current in
+            guard current.listener == .unregistered else { return false }
+            current.listener = .registering
+            return true
+        }
+        guard shouldRegister else { return }
+
+        var address = Self.devicesAddress
+        let status = AudioObjectAddPropertyListenerBlock(
+            AudioObjectID(kAudioObjectSystemObject), &address, listenerQueue, devicesListener
+        )
+        state.withLock { $0.listener = status == noErr ? .registered : .failed }
+    }
+
+    private func removeDevicesListener() {
+        guard state.withLock({ $0.listener == .registered }) else { return }
+        var address = Self.devicesAddress
+        _ = AudioObjectRemovePropertyListenerBlock(
+            AudioObjectID(kAudioObjectSystemObject), &address, listenerQueue, devicesListener
+        )
+    }
+
     private func getAllDeviceIDs() throws -> [AudioDeviceID] {
         var address = AudioObjectPropertyAddress(
             mSelector: kAudioHardwarePropertyDevices,
@@ -116,14 +240,16 @@ public final class AudioDeviceManager: Sendable {
             mScope: kAudioObjectPropertyScopeGlobal,
             mElement: kAudioObjectPropertyElementMain
         )
-        var size = UInt32(MemoryLayout<Unmanaged<CFString>>.size)
-        let buffer = UnsafeMutableRawPointer.allocate(
-            byteCount: Int(size), alignment: MemoryLayout<Unmanaged<CFString>>.alignment
-        )
-        defer { buffer.deallocate() }
-        let status = AudioObjectGetPropertyData(deviceID, &address, 0, nil, &size, buffer)
+        // Read straight into a stack slot — this runs twice per device, so avoid a heap buffer each time.
+        var cfString: Unmanaged<CFString>?
+        var size = UInt32(MemoryLayout<Unmanaged<CFString>?>.size)
+        let status = withUnsafeMutablePointer(to: &cfString) { pointer in
+            AudioObjectGetPropertyData(deviceID, &address, 0, nil, &size, pointer)
+        }
         guard status == noErr else { throw AudioDeviceError.coreAudioError(status) }
-        let cfString = buffer.assumingMemoryBound(to: Unmanaged<CFString>.self).pointee
+        guard let cfString else {
+            throw AudioDeviceError.coreAudioError(OSStatus(kAudioHardwareUnspecifiedError))
+        }
         return cfString.takeRetainedValue() as String
     }
 
@@ -22,15 +22,86 @@ struct AudioDeviceManagerTests {
         #expect(device.sampleRate > 0)
     }
 
-    @Test func test_resolveDevice_nilUID_returnsDefault() throws {
-        let resolved = try manager.resolveDevice(preferredUID: nil)
-        let defaultDevice = try manager.defaultInputDevice()
-        #expect(resolved == defaultDevice)
+    @Test func test_deviceForUID_matchesListedDevice() throws {
+        let listed = try #require(try manager.listInputDevices().first)
+        let device = try manager.device(forUID: listed.uid)
+        #expect(device == listed)
     }
 
-    @Test func test_resolveDevice_unknownUID_fallsBackToDefault() throws {
-        let resolved = try manager.resolveDevice(preferredUID: "nonexistent-device-uid")
+    @Test(arguments: [nil, "nonexistent-device-uid"] as [String?])
+    func test_resolveDevice_unmatchedUID_fallsBackToDefault(preferredUID: String?) throws {
+        let resolved = try manager.resolveDevice(preferredUID: preferredUID)
         let defaultDevice = try manager.defaultInputDevice()
         #expect(resolved == defaultDevice)
     }
 }
+
+@Suite("AudioDeviceManager cache")
+struct AudioDeviceManagerCacheTests {
+    let clock = ManualClock()
+    let enumerator = CountingEnumerator()
+
+    private func makeSUT() -> AudioDeviceManager {
+        AudioDeviceManager(
+            cacheTTL: .seconds(5),
+            now: { [clock] in clock.now() },
+            enumerator: { [enumerator] in enumerator.enumerate() }
+        )
+    }
+
+    @Test func test_listInputDevices_withinTTL_servesCache() throws {
+        let manager = makeSUT()
+
+        let first = try manager.listInputDevices()
+        clock.elapsed = .seconds(4)
+        let second = try manager.listInputDevices()
+
+        #expect(enumerator.calls == 1)
+        #expect(second == first)
+    }
+
+    @Test func test_listInputDevices_afterTTL_reenumerates() throws {
+        let manager = makeSUT()
+
+        _ = try manager.listInputDevices()
+        clock.elapsed = .seconds(5)
+        _ = try manager.listInputDevices()
+
+        #expect(enumerator.calls == 2)
+    }
+
+    @Test func test_invalidateDeviceCache_reenumerates() throws {
+        let manager = makeSUT()
+
+        _ = try manager.listInputDevices()
+        manager.invalidateDeviceCache()
+        _ = try manager.listInputDevices()
+
+        #expect(enumerator.calls == 2)
+    }
+
+    @Test func test_deviceForUID_servesFromCache() throws {
+        let device = AudioDevice.fixture()
+        enumerator.devices = [.fixture(), device]
+        let manager = makeSUT()
+
+        _ = try manager.listInputDevices()
+        let found = try manager.device(forUID: device.uid)
+
+        #expect(found == device)
+        #expect(enumerator.calls == 1)
+    }
+
+    @Test func test_invalidationDuringEnumeration_discardsResult() throws {
+        let manager = makeSUT()
+        enumerator.onEnumerate = { [enumerator] in
+            enumerator.onEnumerate = nil
+            manager.invalidateDeviceCache()
+        }
+
+        _ = try manager.listInputDevices()
+        _ = try manager.listInputDevices()
+
+        #expect(enumerator.calls == 2)
+    }
+}
@@ -71,28 +71,19 @@ struct CommandMatcherTests {
         #expect(result == [.action("selectAll")])
     }
 
-    @Test func test_match_repeatWithNumberWord() {
+    static let repeatCases: [(transcription: String, expectedRepeat: Int)] = [
+        ("down five times", 5),
+        ("down 3 times", 3),
+        ("down two hundred times", 200),
+    ]
+
+    @Test(arguments: repeatCases)
+    func test_match_repeatSuffix(transcription: String, expectedRepeat: Int) {
         let matcher = CommandMatcher(commands: .fixture(keys: ["down": "down"]))
 
-        let result = matcher.match("down five times")
+        let result = matcher.match(transcription)
 
-        #expect(result == [.keystroke(key: "down", modifiers: [], repeat: 5)])
-    }
-
-    @Test func test_match_repeatWithDigitString() {
-        let matcher = CommandMatcher(commands: .fixture(keys: ["down": "down"]))
-
-        let result = matcher.match("down 3 times")
-
-        #expect(result == [.keystroke(key: "down", modifiers: [], repeat: 3)])
-    }
-
-    @Test func test_match_repeatWithHundred() {
-        let matcher = CommandMatcher(commands: .fixture(keys: ["down": "down"]))
-
-        let result = matcher.match("down two hundred times")
-
-        #expect(result == [.keystroke(key: "down", modifiers: [], repeat: 200)])
+        #expect(result == [.keystroke(key: "down", modifiers: [], repeat: expectedRepeat)])
     }
 
     @Test func test_match_fuzzyFallback_matchesCloseWord() {
@@ -0,0 +1,34 @@
+import CoreAudio
+import Foundation
+@testable import ModalDictationCore
+
+extension AudioDevice {
+    static func fixture(
+        audioDeviceID: AudioDeviceID = .random(in: 1...1000),
+        uid: String = "device-\(UUID().uuidString.prefix(8))",
+        name: String = "Mic \(Int.random(in: 1...99))",
+        sampleRate: Float64 = 48_000
+    ) -> AudioDevice {
+        AudioDevice(audioDeviceID: audioDeviceID, uid: uid, name: name, sampleRate: sampleRate)
+    }
+}
+
+// Class (not actor) because the enumerator and clock closures are synchronous.
+final class ManualClock: @unchecked Sendable {
+    private let start = ContinuousClock.now
+    var elapsed: Duration = .zero
+
+    func now() -> ContinuousClock.Instant { start + elapsed }
+}
+
+final class CountingEnumerator: @unchecked Sendable {
+    var devices: [AudioDevice] = [.fixture()]
+    var onEnumerate: (() -> Void)?
+    private(set) var calls = 0
+
+    func enumerate() -> [AudioDevice] {
+        calls += 1
+        onEnumerate?()
+        return devices
+    }
+}